@@ -4,119 +4,170 @@ Flask Web Application for Personal Task & Habit Tracker
 A modern web interface for the task and habit tracking system.
 """
 
-from flask import Flask, render_template, request, redirect, url_for, jsonify, flash
-from main import TaskTracker, Priority, TaskStatus
-from datetime import datetime
-import json
+from flask import Blueprint, Flask, g, render_template, request, redirect, url_for, flash
+from werkzeug.exceptions import HTTPException
+from main import TaskTracker, Priority
+from datetime import date, datetime
+import atexit
+import os
+import orjson
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'  # Change this in production
+app.url_map.strict_slashes = False
+
+# API routes live on a blueprint so the /api prefix is compiled once
+api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 # Global tracker instance
 tracker = TaskTracker("web_tracker_data.json")
+atexit.register(tracker._flush)  # make sure coalesced writes hit disk on shutdown
+
+def json_response(payload, status=200):
+    """Serialize a response with orjson, skipping jsonify's slower encoder"""
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def parse_json(req):
+    """Decode a JSON request body with orjson, bypassing get_json's caching"""
+    return orjson.loads(req.get_data(cache=False))
+
+# Fixed response bodies serialized once at import; the fast paths return
+# these bytes as-is instead of re-encoding the same payload per request
+_OK_TASK_ADDED = orjson.dumps({'success': True, 'message': 'Task added successfully'})
+_OK_TASK_COMPLETED = orjson.dumps({'success': True, 'message': 'Task completed'})
+_OK_TASK_DELETED = orjson.dumps({'success': True, 'message': 'Task deleted'})
+_OK_HABIT_ADDED = orjson.dumps({'success': True, 'message': 'Habit added successfully'})
+_OK_HABIT_DELETED = orjson.dumps({'success': True, 'message': 'Habit deleted'})
+_ERR_TITLE_REQUIRED = orjson.dumps({'error': 'Title is required'})
+_ERR_NAME_REQUIRED = orjson.dumps({'error': 'Name is required'})
+_ERR_TASK_NOT_FOUND = orjson.dumps({'error': 'Task not found'})
+_ERR_HABIT_NOT_FOUND = orjson.dumps({'error': 'Habit not found'})
+_ERR_ALREADY_DONE = orjson.dumps({'error': 'Already completed today'})
+
+def canned_response(body, status=200):
+    """Wrap a pre-serialized JSON body in a response"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+@app.before_request
+def _reset_request_clock():
+    g._now_iso = None
+
+def now_iso():
+    """ISO timestamp for the current request, read from the clock at most once"""
+    if g._now_iso is None:
+        g._now_iso = datetime.now().isoformat()
+    return g._now_iso
+
+@app.errorhandler(Exception)
+def handle_error(e):
+    """Single JSON error handler so endpoints don't need try/except"""
+    if isinstance(e, HTTPException):
+        return e
+    return json_response({'error': str(e)}, status=500)
+
+# Priority emoji value -> member, skipping EnumMeta dispatch per request
+_PRIORITY_BY_VALUE = {p.value: p for p in Priority}
+
+# Rendered index page cached against the tracker revision it was built from
+_index_cache = None
 
 @app.route('/')
 def index():
     """Main sticky notes page"""
-    return render_template('index.html', tasks=tracker.tasks)
+    global _index_cache
+    etag = f'W/"{tracker._rev}"'
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    if _index_cache is not None and _index_cache[0] == tracker._rev:
+        html = _index_cache[1]
+    else:
+        html = render_template('index.html', tasks=tracker.tasks)
+        _index_cache = (tracker._rev, html)
+
+    response = app.make_response(html)
+    response.headers['ETag'] = etag
+    return response
 
 # API Endpoints
-@app.route('/api/task', methods=['POST'])
+@api_bp.route('/task', methods=['POST'])
 def add_task():
     """Add a new task"""
-    try:
-        data = request.json
-        title = data.get('title', '').strip()
-        description = data.get('description', '').strip()
-        priority = Priority(data.get('priority', Priority.MEDIUM.value))
-        tags = [tag.strip() for tag in data.get('tags', '').split(',') if tag.strip()]
-        
-        if not title:
-            return jsonify({'error': 'Title is required'}), 400
-        
-        tracker.add_task(title, description, priority, tags)
-        return jsonify({'success': True, 'message': 'Task added successfully'})
+    data = parse_json(request)
+    title = data.get('title', '').strip()
+    description = data.get('description', '').strip()
+    priority = _PRIORITY_BY_VALUE.get(data.get('priority'), Priority.MEDIUM)
+    raw_tags = data.get('tags', '')
+    # Generator strips each tag once; empty input skips the split entirely
+    tags = [s for s in (t.strip() for t in raw_tags.split(',')) if s] if raw_tags else []
+    
+    if not title:
+        return canned_response(_ERR_TITLE_REQUIRED, status=400)
     
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    tracker.add_task(title, description, priority, tags)
+    return canned_response(_OK_TASK_ADDED)
 
-@app.route('/api/task/<int:task_id>/complete', methods=['POST'])
+@api_bp.route('/task/<int:task_id>/complete', methods=['POST'])
 def complete_task(task_id):
     """Mark a task as completed"""
-    try:
-        for task in tracker.tasks:
-            if task.id == task_id:
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.now().isoformat()
-                tracker.save_data()
-                return jsonify({'success': True, 'message': 'Task completed'})
-        
-        return jsonify({'error': 'Task not found'}), 404
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    task = tracker._task_by_id.get(task_id)
+    if task is None:
+        return canned_response(_ERR_TASK_NOT_FOUND, status=404)
 
-@app.route('/api/task/<int:task_id>/delete', methods=['DELETE'])
+    tracker._set_completed(task, now_iso())
+    tracker.mark_dirty()
+    return canned_response(_OK_TASK_COMPLETED)
+
+@api_bp.route('/task/<int:task_id>/delete', methods=['DELETE'])
 def delete_task(task_id):
     """Delete a task"""
-    try:
-        tracker.tasks = [t for t in tracker.tasks if t.id != task_id]
-        tracker.save_data()
-        return jsonify({'success': True, 'message': 'Task deleted'})
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    tracker.delete_task(task_id)
+    return canned_response(_OK_TASK_DELETED)
 
-@app.route('/api/habit', methods=['POST'])
+@api_bp.route('/habit', methods=['POST'])
 def add_habit():
     """Add a new habit"""
-    try:
-        data = request.json
-        name = data.get('name', '').strip()
-        description = data.get('description', '').strip()
-        target_days = int(data.get('target_days', 30))
-        
-        if not name:
-            return jsonify({'error': 'Name is required'}), 400
-        
-        tracker.add_habit(name, description, target_days)
-        return jsonify({'success': True, 'message': 'Habit added successfully'})
+    data = parse_json(request)
+    name = data.get('name', '').strip()
+    description = data.get('description', '').strip()
+    target_days = int(data.get('target_days', 30))
     
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    if not name:
+        return canned_response(_ERR_NAME_REQUIRED, status=400)
+    
+    tracker.add_habit(name, description, target_days)
+    return canned_response(_OK_HABIT_ADDED)
 
-@app.route('/api/habit/<habit_name>/complete', methods=['POST'])
+@api_bp.route('/habit/<habit_name>/complete', methods=['POST'])
 def complete_habit(habit_name):
     """Mark a habit as completed for today"""
-    try:
-        today = datetime.now().date().isoformat()
-        
-        for habit in tracker.habits:
-            if habit.name.lower() == habit_name.lower():
-                if today in habit.completed_dates:
-                    return jsonify({'error': 'Already completed today'}), 400
-                
-                habit.completed_dates.append(today)
-                habit.current_streak += 1
-                habit.longest_streak = max(habit.longest_streak, habit.current_streak)
-                tracker.save_data()
-                return jsonify({'success': True, 'message': 'Habit completed', 'streak': habit.current_streak})
-        
-        return jsonify({'error': 'Habit not found'}), 404
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    today = date.today().isoformat()
+
+    habit = tracker._habit_by_name.get(habit_name.lower())
+    if habit is None:
+        return canned_response(_ERR_HABIT_NOT_FOUND, status=404)
+
+    with tracker._lock:
+        if today in habit._completed_set:
+            return canned_response(_ERR_ALREADY_DONE, status=400)
 
-@app.route('/api/habit/<habit_name>/delete', methods=['DELETE'])
+        habit.completed_dates.append(today)
+        habit._completed_set.add(today)
+        cs = habit.current_streak + 1
+        habit.current_streak = cs
+        if cs > habit.longest_streak:
+            habit.longest_streak = cs
+        tracker._total_streak += 1
+    tracker.mark_dirty()
+    return json_response({'success': True, 'message': 'Habit completed', 'streak': cs})
+
+@api_bp.route('/habit/<habit_name>/delete', methods=['DELETE'])
 def delete_habit(habit_name):
     """Delete a habit"""
-    try:
-        tracker.habits = [h for h in tracker.habits if h.name != habit_name]
-        tracker.save_data()
-        return jsonify({'success': True, 'message': 'Habit deleted'})
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    tracker.delete_habit(habit_name)
+    return canned_response(_OK_HABIT_DELETED)
+
+app.register_blueprint(api_bp)
 
 # Form-based routes for non-JS browsers
 @app.route('/add_task', methods=['POST'])
@@ -124,11 +175,11 @@ def add_task_form():
     """Add task via form submission"""
     title = request.form.get('title', '').strip()
     description = request.form.get('description', '').strip()
-    priority_value = request.form.get('priority', Priority.MEDIUM.value)
-    tags = [tag.strip() for tag in request.form.get('tags', '').split(',') if tag.strip()]
-    
+    priority = _PRIORITY_BY_VALUE.get(request.form.get('priority'), Priority.MEDIUM)
+    raw_tags = request.form.get('tags', '')
+    tags = [s for s in (t.strip() for t in raw_tags.split(',')) if s] if raw_tags else []
+
     if title:
-        priority = Priority(priority_value)
         tracker.add_task(title, description, priority, tags)
         flash('Task added successfully!', 'success')
     else:
@@ -154,31 +205,35 @@ def add_habit_form():
 @app.route('/complete_task/<int:task_id>')
 def complete_task_form(task_id):
     """Complete task via URL"""
-    for task in tracker.tasks:
-        if task.id == task_id:
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.now().isoformat()
-            tracker.save_data()
-            flash(f'Task "{task.title}" completed!', 'success')
-            break
+    task = tracker._task_by_id.get(task_id)
+    if task is not None:
+        tracker._set_completed(task, now_iso())
+        tracker.mark_dirty()
+        flash(f'Task "{task.title}" completed!', 'success')
     return redirect(url_for('tasks'))
 
 @app.route('/complete_habit/<habit_name>')
 def complete_habit_form(habit_name):
     """Complete habit via URL"""
-    today = datetime.now().date().isoformat()
+    today = date.today().isoformat()
     
-    for habit in tracker.habits:
-        if habit.name.lower() == habit_name.lower():
-            if today not in habit.completed_dates:
+    habit = tracker._habit_by_name.get(habit_name.lower())
+    if habit is not None:
+        with tracker._lock:
+            done = today in habit._completed_set
+            if not done:
                 habit.completed_dates.append(today)
-                habit.current_streak += 1
-                habit.longest_streak = max(habit.longest_streak, habit.current_streak)
-                tracker.save_data()
-                flash(f'Habit "{habit.name}" completed! Streak: {habit.current_streak} days', 'success')
-            else:
-                flash(f'Habit "{habit.name}" already completed today!', 'warning')
-            break
+                habit._completed_set.add(today)
+                cs = habit.current_streak + 1
+                habit.current_streak = cs
+                if cs > habit.longest_streak:
+                    habit.longest_streak = cs
+                tracker._total_streak += 1
+        if not done:
+            tracker.mark_dirty()
+            flash(f'Habit "{habit.name}" completed! Streak: {cs} days', 'success')
+        else:
+            flash(f'Habit "{habit.name}" already completed today!', 'warning')
     return redirect(url_for('habits'))
 
 if __name__ == '__main__':
@@ -195,4 +250,10 @@ if __name__ == '__main__':
     
     print("🚀 Starting Task & Habit Tracker Web App...")
     print("📱 Open http://localhost:5001 in your browser")
-    app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
+    if os.environ.get('DEV'):
+        # Werkzeug debug server with the reloader: development only
+        app.run(debug=True, host='0.0.0.0', port=5001)
+    else:
+        # Tracker state lives in this process, so deploy exactly one worker
+        # (see wsgi.py), e.g.  gunicorn -w 1 -k gthread --threads 4 wsgi:application
+        app.run(host='0.0.0.0', port=5001, threaded=True)
\ No newline at end of file
@@ -53,7 +53,7 @@ def demo():
     # Show stats
     print("\n" + "="*50)
     total_tasks = len(tracker.tasks)
-    completed_tasks = sum(1 for t in tracker.tasks if t.status.value == "✅")
+    completed_tasks = tracker._completed_count
     total_habits = len(tracker.habits)
     
     print("📊 STATISTICS")
@@ -62,7 +62,7 @@ def demo():
     print(f"🎯 Habits: {total_habits} being tracked")
     
     if tracker.habits:
-        avg_streak = sum(h.current_streak for h in tracker.habits) / len(tracker.habits)
+        avg_streak = tracker._total_streak / len(tracker.habits)
         print(f"🔥 Average streak: {avg_streak:.1f} days")
     
     print("\n✨ Demo complete! The interactive app supports:")
@@ -4,6 +4,7 @@ Interactive demo that simulates user commands for the Task & Habit Tracker
 """
 
 from main import TaskTracker, Priority
+import os
 import time
 
 def simulate_command(command, description=""):
@@ -11,7 +12,9 @@ def simulate_command(command, description=""):
     print(f"\n💻 > {command}")
     if description:
         print(f"   {description}")
-    time.sleep(0.5)
+    # Pause only when asked, e.g. DEMO_PAUSE=0.5 python interactive_demo.py
+    if os.environ.get('DEMO_PAUSE'):
+        time.sleep(float(os.environ['DEMO_PAUSE']))
 
 def run_interactive_demo():
     print("🚀 Welcome to Personal Task & Habit Tracker!")
@@ -85,7 +88,7 @@ def run_interactive_demo():
     # Show stats
     simulate_command("stats", "Check our progress statistics")
     total_tasks = len(tracker.tasks)
-    completed_tasks = sum(1 for t in tracker.tasks if t.status.value == "✅")
+    completed_tasks = tracker._completed_count
     total_habits = len(tracker.habits)
     
     print("\n📊 STATISTICS")
@@ -94,7 +97,7 @@ def run_interactive_demo():
     print(f"🎯 Habits: {total_habits} being tracked")
     
     if tracker.habits:
-        avg_streak = sum(h.current_streak for h in tracker.habits) / len(tracker.habits)
+        avg_streak = tracker._total_streak / len(tracker.habits)
         print(f"🔥 Average streak: {avg_streak:.1f} days")
     
     # Show JSON data was saved
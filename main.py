@@ -11,14 +11,38 @@ Features:
 - Statistics and insights
 """
 
+import atexit
+import http.client
 import json
 import os
 import subprocess
+import sys
+import threading
+import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # CLI still works without the faster serializer
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # large files fall back to a single whole-file parse
+    ijson = None
+
+# Errors that mean the data file is unreadable rather than a bug
+_LOAD_ERRORS = (json.JSONDecodeError, KeyError, ValueError)
+if ijson is not None:
+    _LOAD_ERRORS += (ijson.JSONError,)
+
+# All 21 possible 20-char progress bars, built once at import
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+_RULE = "=" * 50
+
 
 class Priority(Enum):
     LOW = "🟢"
@@ -48,6 +72,19 @@ class Task:
         if self.tags is None:
             self.tags = []
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for serialization, avoiding asdict's deepcopy walk"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "priority": self.priority.value,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+            "tags": self.tags,
+        }
+
 
 @dataclass
 class Habit:
@@ -59,233 +96,523 @@ class Habit:
     completed_dates: List[str]
     created_at: str
 
+    def __post_init__(self):
+        # Set mirror of completed_dates for O(1) membership checks (not serialized)
+        self._completed_set = set(self.completed_dates)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for serialization, avoiding asdict's deepcopy walk"""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "target_days": self.target_days,
+            "current_streak": self.current_streak,
+            "longest_streak": self.longest_streak,
+            # Sorted for stable, diff-friendly JSON output
+            "completed_dates": sorted(self.completed_dates),
+            "created_at": self.created_at,
+        }
+
 
 class GitHubIntegration:
-    """GitHub CLI integration for managing issues and pull requests"""
-    
+    """GitHub integration for managing issues and pull requests.
+
+    Talks to api.github.com directly over a kept-alive HTTPS connection;
+    the gh CLI is only shelled out to once, to fetch the auth token.
+    """
+
+    # How long a cached 'gh auth status' result stays valid
+    _AUTH_CACHE_TTL = 300
+    _AUTH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "supertracker", "gh_auth")
+
     def __init__(self):
-        self.authenticated = self._check_auth()
-    
+        self._authenticated: Optional[bool] = None
+        self._token: Optional[str] = None
+        self._repo: Optional[str] = None  # "owner/name"
+        self._repo_id: Optional[str] = None
+        self._conn: Optional[http.client.HTTPSConnection] = None
+
+    @property
+    def authenticated(self) -> bool:
+        """Auth status, checked lazily on first use so plain tracker
+        sessions never pay for a 'gh auth status' subprocess."""
+        if self._authenticated is None:
+            self._authenticated = self._check_auth()
+        return self._authenticated
+
     def _check_auth(self) -> bool:
-        """Check if user is authenticated with GitHub CLI"""
+        """Check if user is authenticated with GitHub CLI (cached briefly on disk)"""
+        try:
+            if time.time() - os.path.getmtime(self._AUTH_CACHE_PATH) < self._AUTH_CACHE_TTL:
+                with open(self._AUTH_CACHE_PATH) as f:
+                    return f.read().strip() == "1"
+        except OSError:
+            pass
+
         try:
             result = subprocess.run(['gh', 'auth', 'status'], capture_output=True, text=True)
-            return result.returncode == 0
+            authenticated = result.returncode == 0
         except (subprocess.SubprocessError, FileNotFoundError):
-            return False
-    
-    def _run_gh_command(self, args: List[str]) -> Optional[Dict[str, Any]]:
-        """Run a gh command and return JSON output"""
+            authenticated = False
+
+        try:
+            os.makedirs(os.path.dirname(self._AUTH_CACHE_PATH), exist_ok=True)
+            with open(self._AUTH_CACHE_PATH, 'w') as f:
+                f.write("1" if authenticated else "0")
+        except OSError:
+            pass
+        return authenticated
+
+    def _get_token(self) -> Optional[str]:
+        """Fetch the GitHub token once via 'gh auth token' and memoize it"""
+        if self._token is None:
+            try:
+                result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True, check=True)
+                self._token = result.stdout.strip()
+            except (subprocess.SubprocessError, FileNotFoundError):
+                self._token = ''
+        return self._token or None
+
+    def _get_repo(self) -> Optional[str]:
+        """Detect "owner/name" from the git remote once and memoize it"""
+        if self._repo is None:
+            try:
+                result = subprocess.run(['git', 'config', '--get', 'remote.origin.url'],
+                                        capture_output=True, text=True, check=True)
+                url = result.stdout.strip()
+            except (subprocess.SubprocessError, FileNotFoundError):
+                url = ''
+
+            repo = ''
+            if 'github.com' in url:
+                # git@github.com:owner/repo.git or https://github.com/owner/repo.git
+                repo = url.split('github.com', 1)[1].lstrip(':/')
+                if repo.endswith('.git'):
+                    repo = repo[:-4]
+            self._repo = repo
+        return self._repo or None
+
+    def _api_request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Issue a GitHub API request, reusing one HTTPS connection"""
+        # Cached auth status first: refusing here skips the token subprocess entirely
         if not self.authenticated:
             print("❌ Not authenticated with GitHub. Run 'gh auth login' first.")
             return None
-        
-        try:
-            cmd = ['gh'] + args + ['--json']
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return json.loads(result.stdout) if result.stdout.strip() else {}
-        except subprocess.CalledProcessError as e:
-            print(f"❌ GitHub command failed: {e}")
-            return None
-        except json.JSONDecodeError:
-            print("❌ Failed to parse GitHub response")
+
+        token = self._get_token()
+        if token is None:
+            print("❌ Not authenticated with GitHub. Run 'gh auth login' first.")
             return None
-    
+
+        headers = {
+            'Authorization': f'Bearer {token}',
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'super-claude-tracker',
+        }
+        body = None
+        if payload is not None:
+            # orjson emits bytes directly, ready for http.client
+            body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        for attempt in (0, 1):
+            try:
+                if self._conn is None:
+                    self._conn = http.client.HTTPSConnection('api.github.com', timeout=10)
+                self._conn.request(method, path, body=body, headers=headers)
+                response = self._conn.getresponse()
+                raw = response.read()
+            except (OSError, http.client.HTTPException):
+                # Stale keep-alive connection: reset and retry once
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+                if attempt:
+                    print("❌ GitHub API request failed")
+                    return None
+                continue
+
+            if response.status >= 400:
+                print(f"❌ GitHub API error {response.status}")
+                return None
+            if not raw.strip():
+                return {}
+            try:
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except ValueError:
+                print("❌ Failed to parse GitHub response")
+                return None
+
     def create_issue(self, title: str, body: str = "", labels: List[str] = None) -> bool:
         """Create a new GitHub issue"""
-        if not self.authenticated:
-            print("❌ Not authenticated with GitHub. Run 'gh auth login' first.")
+        repo = self._get_repo()
+        if repo is None:
+            print("❌ Could not detect a GitHub repository")
             return False
-        
-        try:
-            cmd = ['gh', 'issue', 'create', '--title', title]
-            if body:
-                cmd.extend(['--body', body])
-            if labels:
-                cmd.extend(['--label', ','.join(labels)])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            issue_url = result.stdout.strip()
-            print(f"✅ Issue created: {issue_url}")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to create issue: {e}")
+
+        payload: Dict[str, Any] = {'title': title}
+        if body:
+            payload['body'] = body
+        if labels:
+            payload['labels'] = labels
+
+        issue = self._api_request('POST', f'/repos/{repo}/issues', payload)
+        if issue is None:
             return False
-    
+        print(f"✅ Issue created: {issue.get('html_url', '')}")
+        return True
+
     def list_issues(self, state: str = "open", limit: int = 10) -> List[Dict[str, Any]]:
         """List GitHub issues"""
-        if not self.authenticated:
-            print("❌ Not authenticated with GitHub. Run 'gh auth login' first.")
+        repo = self._get_repo()
+        if repo is None:
+            print("❌ Could not detect a GitHub repository")
             return []
-        
-        try:
-            cmd = ['gh', 'issue', 'list', '--state', state, '--limit', str(limit), '--json', 'number,title,state,labels,assignees,createdAt']
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            issues = json.loads(result.stdout) if result.stdout.strip() else []
-            
-            if not issues:
-                print(f"📝 No {state} issues found")
-                return []
-            
-            print(f"\n🐛 GITHUB ISSUES ({state.upper()})")
-            print("=" * 60)
-            
-            for issue in issues:
-                labels_str = f" [{', '.join([l['name'] for l in issue.get('labels', [])])}]" if issue.get('labels') else ""
-                assignees_str = f" 👤 {', '.join([a['login'] for a in issue.get('assignees', [])])}" if issue.get('assignees') else ""
-                print(f"#{issue['number']} {issue['title']}{labels_str}{assignees_str}")
-            
-            return issues
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            print(f"❌ Failed to list issues: {e}")
+
+        items = self._api_request('GET', f'/repos/{repo}/issues?state={state}&per_page={limit}')
+        if items is None:
             return []
-    
+        # The REST issues endpoint also returns pull requests; drop them
+        issues = [i for i in items if 'pull_request' not in i]
+
+        if not issues:
+            print(f"📝 No {state} issues found")
+            return []
+
+        # Build every line first, then emit them in one write
+        lines = [f"\n🐛 GITHUB ISSUES ({state.upper()})", "=" * 60]
+        for issue in issues:
+            labels = issue.get('labels')
+            labels_str = f" [{', '.join(l['name'] for l in labels)}]" if labels else ""
+            assignees = issue.get('assignees')
+            assignees_str = f" 👤 {', '.join(a['login'] for a in assignees)}" if assignees else ""
+            lines.append(f"#{issue['number']} {issue['title']}{labels_str}{assignees_str}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        return issues
+
     def create_pr(self, title: str, body: str = "", base: str = "main") -> bool:
-        """Create a new pull request"""
-        if not self.authenticated:
-            print("❌ Not authenticated with GitHub. Run 'gh auth login' first.")
+        """Create a new pull request from the current branch"""
+        repo = self._get_repo()
+        if repo is None:
+            print("❌ Could not detect a GitHub repository")
             return False
-        
+
         try:
-            cmd = ['gh', 'pr', 'create', '--title', title, '--base', base]
-            if body:
-                cmd.extend(['--body', body])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            pr_url = result.stdout.strip()
-            print(f"✅ Pull request created: {pr_url}")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to create PR: {e}")
+            result = subprocess.run(['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+                                    capture_output=True, text=True, check=True)
+            head = result.stdout.strip()
+        except (subprocess.SubprocessError, FileNotFoundError):
+            print("❌ Could not detect the current branch")
             return False
-    
+
+        payload: Dict[str, Any] = {'title': title, 'head': head, 'base': base}
+        if body:
+            payload['body'] = body
+
+        pr = self._api_request('POST', f'/repos/{repo}/pulls', payload)
+        if pr is None:
+            return False
+        print(f"✅ Pull request created: {pr.get('html_url', '')}")
+        return True
+
     def list_prs(self, state: str = "open", limit: int = 10) -> List[Dict[str, Any]]:
         """List GitHub pull requests"""
-        if not self.authenticated:
-            print("❌ Not authenticated with GitHub. Run 'gh auth login' first.")
+        repo = self._get_repo()
+        if repo is None:
+            print("❌ Could not detect a GitHub repository")
             return []
-        
-        try:
-            cmd = ['gh', 'pr', 'list', '--state', state, '--limit', str(limit), '--json', 'number,title,state,author,createdAt,headRefName']
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            prs = json.loads(result.stdout) if result.stdout.strip() else []
-            
-            if not prs:
-                print(f"📝 No {state} pull requests found")
-                return []
-            
-            print(f"\n🔀 PULL REQUESTS ({state.upper()})")
-            print("=" * 60)
-            
-            for pr in prs:
-                author = pr.get('author', {}).get('login', 'Unknown')
-                branch = pr.get('headRefName', '')
-                print(f"#{pr['number']} {pr['title']} (by {author} from {branch})")
-            
-            return prs
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            print(f"❌ Failed to list PRs: {e}")
+
+        prs = self._api_request('GET', f'/repos/{repo}/pulls?state={state}&per_page={limit}')
+        if prs is None:
             return []
-    
+
+        if not prs:
+            print(f"📝 No {state} pull requests found")
+            return []
+
+        lines = [f"\n🔀 PULL REQUESTS ({state.upper()})", "=" * 60]
+        for pr in prs:
+            author = pr.get('user', {}).get('login', 'Unknown')
+            branch = pr.get('head', {}).get('ref', '')
+            lines.append(f"#{pr['number']} {pr['title']} (by {author} from {branch})")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        return prs
+
     def sync_task_to_issue(self, task: 'Task') -> bool:
         """Convert a task to a GitHub issue"""
         labels = task.tags + [f"priority-{task.priority.name.lower()}"]
         body = f"**Description:** {task.description}\n\n**Priority:** {task.priority.value} {task.priority.name}\n\n**Created:** {task.created_at}"
-        
+
         return self.create_issue(task.title, body, labels)
 
+    def sync_tasks_to_issues(self, tasks: List['Task']) -> bool:
+        """Convert many tasks to GitHub issues with a single GraphQL call"""
+        if not tasks:
+            return True
+
+        if self._repo_id is None:
+            repo = self._get_repo()
+            if repo is None:
+                print("❌ Could not detect a GitHub repository")
+                return False
+            info = self._api_request('GET', f'/repos/{repo}')
+            if not info:
+                return False
+            self._repo_id = info['node_id']
+
+        # One aliased createIssue node per task, all in one mutation
+        nodes = []
+        for i, task in enumerate(tasks):
+            body = f"**Description:** {task.description}\n\n**Priority:** {task.priority.value} {task.priority.name}\n\n**Created:** {task.created_at}"
+            issue_input = f"{{repositoryId: {json.dumps(self._repo_id)}, title: {json.dumps(task.title)}, body: {json.dumps(body)}}}"
+            nodes.append(f"i{i}: createIssue(input: {issue_input}) {{ issue {{ url }} }}")
+        mutation = "mutation {\n" + "\n".join(nodes) + "\n}"
+
+        response = self._api_request('POST', '/graphql', {'query': mutation})
+        if not response:
+            return False
+
+        for node in (response.get('data') or {}).values():
+            url = (node or {}).get('issue', {}).get('url')
+            if url:
+                print(f"✅ Issue created: {url}")
+        return True
+
 
 class TaskTracker:
+    # Stream-parse data files larger than this; smaller ones load faster whole
+    _STREAM_THRESHOLD = 1 << 20
+
     def __init__(self, data_file: str = "tracker_data.json"):
         self.data_file = data_file
-        self.tasks: List[Task] = []
+        # Tasks are partitioned by status so the default listing never walks history
+        self._pending_tasks: List[Task] = []
+        self._completed_tasks: List[Task] = []
         self.habits: List[Habit] = []
+        # O(1) lookup indexes (habits keyed by lowercase name)
+        self._task_by_id: Dict[int, Task] = {}
+        self._task_pos: Dict[int, int] = {}  # task id -> index within its status bucket
+        self._habit_by_name: Dict[str, Habit] = {}
         self.next_task_id = 1
+        # Monotonic revision counter, bumped on every mutation (cache invalidation key)
+        self._rev = 0
+        # Running stat counters so stats renders don't rescan the collections
+        self._completed_count = 0
+        self._total_streak = 0
+        # Timestamps cached per command tick by the CLI loop (None = read the clock)
+        self._now: Optional[str] = None
+        self._today: Optional[str] = None
+        # Guards all state mutations and save_data snapshots: the flush timer
+        # (and a threaded web server) touch tracker state from other threads
+        self._lock = threading.RLock()
+        # Coalesced-save state: mark_dirty() batches bursts of mutations into one write
+        self._dirty = False
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
         self.github = GitHubIntegration()
         self.load_data()
+        # Guarantee pending coalesced writes reach disk no matter how we exit
+        atexit.register(self._flush)
+
+    @property
+    def tasks(self) -> List[Task]:
+        """All tasks, pending first (concatenation of the status buckets)"""
+        return self._pending_tasks + self._completed_tasks
+
+    def _bucket_of(self, task: Task) -> List[Task]:
+        """The status bucket a task currently belongs to"""
+        return self._completed_tasks if task.status == TaskStatus.COMPLETED else self._pending_tasks
+
+    def _bucket_append(self, task: Task):
+        """Add a task to its status bucket, recording its position"""
+        bucket = self._bucket_of(task)
+        self._task_pos[task.id] = len(bucket)
+        bucket.append(task)
+
+    def _bucket_remove(self, task: Task):
+        """Swap-remove a task from its status bucket in O(1)"""
+        bucket = self._bucket_of(task)
+        idx = self._task_pos.pop(task.id)
+        last = bucket[-1]
+        if last is not task:
+            bucket[idx] = last
+            self._task_pos[last.id] = idx
+        bucket.pop()
+
+    def _set_completed(self, task: Task, completed_at: str):
+        """Mark a task completed, moving it between buckets and counting it once"""
+        with self._lock:
+            if task.status != TaskStatus.COMPLETED:
+                self._completed_count += 1
+                self._bucket_remove(task)
+                task.status = TaskStatus.COMPLETED
+                self._bucket_append(task)
+            task.completed_at = completed_at
+
+    def mark_dirty(self, delay: float = 0.25):
+        """Flag unsaved changes and schedule a single coalesced save_data"""
+        with self._flush_lock:
+            self._rev += 1
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(delay, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush(self):
+        """Write pending changes to disk (no-op if nothing is dirty)"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        self.save_data()
+
+    def save_data(self, pretty: bool = False):
+        """Save all data to JSON file (compact by default, pretty for debugging)"""
+        # Snapshot under the lock so a concurrent mutation can't tear the state
+        with self._lock:
+            data = {
+                "tasks": [task.to_dict() for task in self.tasks],
+                "habits": [habit.to_dict() for habit in self.habits],
+                "next_task_id": self.next_task_id
+            }
+        if orjson is not None:
+            # orjson emits bytes directly, skipping the UTF-8 round-trip
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            if pretty:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            else:
+                payload = json.dumps(data, separators=(",", ":")).encode('utf-8')
+
+        # Single write to a temp file, then atomic rename so a crash can't tear the file
+        tmp_path = f"{self.data_file}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.data_file)
     
-    def save_data(self):
-        """Save all data to JSON file"""
-        # Convert tasks to dict with enum values as strings
-        tasks_data = []
-        for task in self.tasks:
-            task_dict = asdict(task)
-            task_dict["priority"] = task.priority.value
-            task_dict["status"] = task.status.value
-            tasks_data.append(task_dict)
-        
-        data = {
-            "tasks": tasks_data,
-            "habits": [asdict(habit) for habit in self.habits],
-            "next_task_id": self.next_task_id
-        }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
-    
+    def _restore_task(self, task_data: Dict[str, Any]):
+        """Rebuild one task and its index entries from saved data"""
+        task_data["priority"] = Priority(task_data["priority"])
+        task_data["status"] = TaskStatus(task_data["status"])
+        task = Task(**task_data)
+        self._bucket_append(task)
+        self._task_by_id[task.id] = task
+        if task.status == TaskStatus.COMPLETED:
+            self._completed_count += 1
+
+    def _restore_habit(self, habit_data: Dict[str, Any]):
+        """Rebuild one habit and its index entries from saved data"""
+        habit = Habit(**habit_data)
+        self.habits.append(habit)
+        self._habit_by_name[habit.name.lower()] = habit
+        self._total_streak += habit.current_streak
+
+    def _load_streaming(self, f):
+        """Construct tasks/habits as records stream off disk (needs ijson)"""
+        builder = None
+        for prefix, event, value in ijson.parse(f):
+            if event == 'start_map' and prefix in ('tasks.item', 'habits.item'):
+                builder = ijson.ObjectBuilder()
+            if builder is not None:
+                builder.event(event, value)
+                if event == 'end_map' and prefix in ('tasks.item', 'habits.item'):
+                    if prefix == 'tasks.item':
+                        self._restore_task(builder.value)
+                    else:
+                        self._restore_habit(builder.value)
+                    builder = None
+            elif prefix == 'next_task_id':
+                self.next_task_id = value
+
     def load_data(self):
         """Load data from JSON file"""
         if not os.path.exists(self.data_file):
             return
-        
+
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-            
-            # Restore tasks
+            if ijson is not None and os.path.getsize(self.data_file) > self._STREAM_THRESHOLD:
+                # Incremental parse for big histories: records materialize one at a time
+                with open(self.data_file, 'rb') as f:
+                    self._load_streaming(f)
+                return
+
+            with open(self.data_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
             for task_data in data.get("tasks", []):
-                task_data["priority"] = Priority(task_data["priority"])
-                task_data["status"] = TaskStatus(task_data["status"])
-                self.tasks.append(Task(**task_data))
-            
-            # Restore habits
+                self._restore_task(task_data)
             for habit_data in data.get("habits", []):
-                self.habits.append(Habit(**habit_data))
-            
+                self._restore_habit(habit_data)
             self.next_task_id = data.get("next_task_id", 1)
-        
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+
+        except _LOAD_ERRORS as e:
             print(f"⚠️ Error loading data: {e}")
     
     def add_task(self, title: str, description: str = "", priority: Priority = Priority.MEDIUM, tags: List[str] = None):
         """Add a new task"""
-        task = Task(
-            id=self.next_task_id,
-            title=title,
-            description=description,
-            priority=priority,
-            status=TaskStatus.PENDING,
-            created_at=datetime.now().isoformat(),
-            tags=tags or []
-        )
-        self.tasks.append(task)
-        self.next_task_id += 1
-        self.save_data()
+        with self._lock:
+            task = Task(
+                id=self.next_task_id,
+                title=title,
+                description=description,
+                priority=priority,
+                status=TaskStatus.PENDING,
+                created_at=self._now or datetime.now().isoformat(),
+                tags=tags or []
+            )
+            self._bucket_append(task)
+            self._task_by_id[task.id] = task
+            self.next_task_id += 1
+        self.mark_dirty()
         print(f"✅ Task added: {task.title}")
     
     def complete_task(self, task_id: int):
         """Mark a task as completed"""
-        for task in self.tasks:
-            if task.id == task_id:
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.now().isoformat()
-                self.save_data()
-                print(f"🎉 Task completed: {task.title}")
-                return
-        print(f"❌ Task {task_id} not found")
-    
+        task = self._task_by_id.get(task_id)
+        if task is None:
+            print(f"❌ Task {task_id} not found")
+            return
+
+        self._set_completed(task, self._now or datetime.now().isoformat())
+        self.mark_dirty()
+        print(f"🎉 Task completed: {task.title}")
+
+    def delete_task(self, task_id: int) -> Optional[Task]:
+        """Remove a task in O(1) via swap-remove (task order is not preserved)"""
+        with self._lock:
+            task = self._task_by_id.pop(task_id, None)
+            if task is None:
+                return None
+
+            if task.status == TaskStatus.COMPLETED:
+                self._completed_count -= 1
+            self._bucket_remove(task)
+        self.mark_dirty()
+        return task
+
     def list_tasks(self, show_completed: bool = False):
         """List all tasks"""
-        if not self.tasks:
+        if not self._pending_tasks and not self._completed_tasks:
             print("📝 No tasks yet! Add some with 'add task'")
             return
-        
+
         print("\n📋 TASKS")
-        print("=" * 50)
-        
-        for task in self.tasks:
-            if not show_completed and task.status == TaskStatus.COMPLETED:
-                continue
-            
+        print(_RULE)
+
+        # Buckets make the default listing O(pending): completed history is never scanned
+        tasks = self._pending_tasks + self._completed_tasks if show_completed else self._pending_tasks
+        for task in tasks:
             tags_str = f" [{', '.join(task.tags)}]" if task.tags else ""
             print(f"{task.id:2d}. {task.status.value} {task.priority.value} {task.title}{tags_str}")
             if task.description:
@@ -300,31 +627,48 @@ class TaskTracker:
             current_streak=0,
             longest_streak=0,
             completed_dates=[],
-            created_at=datetime.now().isoformat()
+            created_at=self._now or datetime.now().isoformat()
         )
-        self.habits.append(habit)
-        self.save_data()
+        with self._lock:
+            self.habits.append(habit)
+            self._habit_by_name[habit.name.lower()] = habit
+        self.mark_dirty()
         print(f"🎯 Habit added: {habit.name}")
     
     def complete_habit(self, habit_name: str):
         """Mark habit as completed for today"""
-        today = datetime.now().date().isoformat()
-        
-        for habit in self.habits:
-            if habit.name.lower() == habit_name.lower():
-                if today in habit.completed_dates:
-                    print(f"✨ Already completed {habit.name} today!")
-                    return
-                
-                habit.completed_dates.append(today)
-                habit.current_streak += 1
-                habit.longest_streak = max(habit.longest_streak, habit.current_streak)
-                self.save_data()
-                print(f"🔥 {habit.name} completed! Streak: {habit.current_streak} days")
-                return
-        
-        print(f"❌ Habit '{habit_name}' not found")
-    
+        today = self._today or datetime.now().date().isoformat()
+
+        habit = self._habit_by_name.get(habit_name.lower())
+        if habit is None:
+            print(f"❌ Habit '{habit_name}' not found")
+            return
+
+        if today in habit._completed_set:
+            print(f"✨ Already completed {habit.name} today!")
+            return
+
+        with self._lock:
+            habit.completed_dates.append(today)
+            habit._completed_set.add(today)
+            habit.current_streak += 1
+            habit.longest_streak = max(habit.longest_streak, habit.current_streak)
+            self._total_streak += 1
+        self.mark_dirty()
+        print(f"🔥 {habit.name} completed! Streak: {habit.current_streak} days")
+
+    def delete_habit(self, habit_name: str) -> Optional[Habit]:
+        """Remove a habit, rolling its streak out of the running totals"""
+        with self._lock:
+            habit = self._habit_by_name.pop(habit_name.lower(), None)
+            if habit is None:
+                return None
+
+            self._total_streak -= habit.current_streak
+            self.habits.remove(habit)
+        self.mark_dirty()
+        return habit
+
     def show_habits(self):
         """Show all habits with progress"""
         if not self.habits:
@@ -332,14 +676,12 @@ class TaskTracker:
             return
         
         print("\n🎯 HABITS")
-        print("=" * 50)
+        print(_RULE)
         
         for habit in self.habits:
             progress = min(habit.current_streak / habit.target_days * 100, 100)
-            bar_length = 20
-            filled = int(bar_length * progress / 100)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            
+            bar = _BARS[int(20 * progress / 100)]
+
             print(f"🔥 {habit.name}")
             print(f"   {bar} {progress:.1f}% ({habit.current_streak}/{habit.target_days} days)")
             print(f"   🏆 Longest streak: {habit.longest_streak} days")
@@ -365,10 +707,17 @@ def main():
         tracker.add_habit("Daily coding", "Write code for at least 30 minutes", 30)
         tracker.add_habit("Exercise", "Any form of physical activity", 21)
         tracker.add_habit("Read", "Read for 15 minutes", 14)
-    
+        # All six seed records land in one write instead of six rewrites
+        tracker._flush()
+
     while True:
         try:
             command = input("\n💻 > ").strip().lower()
+
+            # One clock read per command; every mutation it triggers reuses it
+            now = datetime.now()
+            tracker._now = now.isoformat()
+            tracker._today = now.date().isoformat()
             
             if command in ['quit', 'exit', 'q']:
                 print("👋 Goodbye! Keep being productive!")
@@ -448,22 +797,26 @@ def main():
                 tracker.complete_habit(habit_name)
             
             elif command == 'stats':
-                total_tasks = len(tracker.tasks)
-                completed_tasks = sum(1 for t in tracker.tasks if t.status == TaskStatus.COMPLETED)
+                # Running counters: no per-task or per-habit scan needed
+                total_tasks = len(tracker._pending_tasks) + len(tracker._completed_tasks)
+                completed_tasks = tracker._completed_count
                 total_habits = len(tracker.habits)
-                
+
                 print("\n📊 STATISTICS")
                 print("=" * 30)
                 print(f"📋 Tasks: {completed_tasks}/{total_tasks} completed")
                 print(f"🎯 Habits: {total_habits} being tracked")
-                
+
                 if tracker.habits:
-                    avg_streak = sum(h.current_streak for h in tracker.habits) / len(tracker.habits)
+                    avg_streak = tracker._total_streak / total_habits
                     print(f"🔥 Average streak: {avg_streak:.1f} days")
             
             else:
                 print("❓ Unknown command. Type 'help' for available commands.")
-        
+
+            # One write per command, however many mutations it made
+            tracker._flush()
+
         except KeyboardInterrupt:
             print("\n👋 Goodbye!")
             break
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for running the tracker under a production server.
+
+Tracker state (tasks, habits, counters) lives in process memory and is
+persisted to one JSON file, so run a single worker — multiple workers
+would each hold their own copy and overwrite each other's saves.
+Threads within that worker are fine; mutations are lock-protected.
+
+Example:
+    gunicorn -w 1 -k gthread --threads 4 wsgi:application
+"""
+
+from app import app as application